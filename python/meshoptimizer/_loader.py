@@ -37,13 +37,18 @@ except ImportError as e:
     print("Make sure the library is properly installed.")
     raise
 
+# Pointer types used to pass numpy arrays to the library
+_UBYTE_P = ctypes.POINTER(ctypes.c_ubyte)
+_UINT_P = ctypes.POINTER(ctypes.c_uint)
+_FLOAT_P = ctypes.POINTER(ctypes.c_float)
+
 # Define function signatures
 def setup_function_signatures() -> None:
     """Set up the function signatures for the library."""
     # Vertex remap functions
     lib.meshopt_generateVertexRemap.argtypes = [
-        ctypes.POINTER(ctypes.c_uint),  # destination
-        ctypes.POINTER(ctypes.c_uint),  # indices
+        _UINT_P,                        # destination
+        _UINT_P,                        # indices
         ctypes.c_size_t,                # index_count
         ctypes.c_void_p,                # vertices
         ctypes.c_size_t,                # vertex_count
@@ -56,22 +61,22 @@ def setup_function_signatures() -> None:
         ctypes.c_void_p,                # vertices
         ctypes.c_size_t,                # vertex_count
         ctypes.c_size_t,                # vertex_size
-        ctypes.POINTER(ctypes.c_uint)   # remap
+        _UINT_P                         # remap
     ]
     lib.meshopt_remapVertexBuffer.restype = None
     
     lib.meshopt_remapIndexBuffer.argtypes = [
-        ctypes.POINTER(ctypes.c_uint),  # destination
-        ctypes.POINTER(ctypes.c_uint),  # indices
+        _UINT_P,                        # destination
+        _UINT_P,                        # indices
         ctypes.c_size_t,                # index_count
-        ctypes.POINTER(ctypes.c_uint)   # remap
+        _UINT_P                         # remap
     ]
     lib.meshopt_remapIndexBuffer.restype = None
     
     # Vertex cache optimization
     lib.meshopt_optimizeVertexCache.argtypes = [
-        ctypes.POINTER(ctypes.c_uint),  # destination
-        ctypes.POINTER(ctypes.c_uint),  # indices
+        _UINT_P,                        # destination
+        _UINT_P,                        # indices
         ctypes.c_size_t,                # index_count
         ctypes.c_size_t                 # vertex_count
     ]
@@ -79,10 +84,10 @@ def setup_function_signatures() -> None:
     
     # Overdraw optimization
     lib.meshopt_optimizeOverdraw.argtypes = [
-        ctypes.POINTER(ctypes.c_uint),  # destination
-        ctypes.POINTER(ctypes.c_uint),  # indices
+        _UINT_P,                        # destination
+        _UINT_P,                        # indices
         ctypes.c_size_t,                # index_count
-        ctypes.POINTER(ctypes.c_float), # vertex_positions
+        _FLOAT_P,                       # vertex_positions
         ctypes.c_size_t,                # vertex_count
         ctypes.c_size_t,                # vertex_positions_stride
         ctypes.c_float                  # threshold
@@ -92,7 +97,7 @@ def setup_function_signatures() -> None:
     # Vertex fetch optimization
     lib.meshopt_optimizeVertexFetch.argtypes = [
         ctypes.c_void_p,                # destination
-        ctypes.POINTER(ctypes.c_uint),  # indices
+        _UINT_P,                        # indices
         ctypes.c_size_t,                # index_count
         ctypes.c_void_p,                # vertices
         ctypes.c_size_t,                # vertex_count
@@ -102,22 +107,22 @@ def setup_function_signatures() -> None:
     
     # Simplification
     lib.meshopt_simplify.argtypes = [
-        ctypes.POINTER(ctypes.c_uint),  # destination
-        ctypes.POINTER(ctypes.c_uint),  # indices
+        _UINT_P,                        # destination
+        _UINT_P,                        # indices
         ctypes.c_size_t,                # index_count
-        ctypes.POINTER(ctypes.c_float), # vertex_positions
+        _FLOAT_P,                       # vertex_positions
         ctypes.c_size_t,                # vertex_count
         ctypes.c_size_t,                # vertex_positions_stride
         ctypes.c_size_t,                # target_index_count
         ctypes.c_float,                 # target_error
         ctypes.c_uint,                  # options
-        ctypes.POINTER(ctypes.c_float)  # result_error
+        _FLOAT_P                        # result_error
     ]
     lib.meshopt_simplify.restype = ctypes.c_size_t
     
     # Simplification scale
     lib.meshopt_simplifyScale.argtypes = [
-        ctypes.POINTER(ctypes.c_float), # vertex_positions
+        _FLOAT_P,                       # vertex_positions
         ctypes.c_size_t,                # vertex_count
         ctypes.c_size_t                 # vertex_positions_stride
     ]
@@ -131,7 +136,7 @@ def setup_function_signatures() -> None:
     lib.meshopt_encodeVertexBufferBound.restype = ctypes.c_size_t
     
     lib.meshopt_encodeVertexBuffer.argtypes = [
-        ctypes.POINTER(ctypes.c_ubyte), # buffer
+        _UBYTE_P,                       # buffer
         ctypes.c_size_t,                # buffer_size
         ctypes.c_void_p,                # vertices
         ctypes.c_size_t,                # vertex_count
@@ -146,9 +151,9 @@ def setup_function_signatures() -> None:
     lib.meshopt_encodeIndexBufferBound.restype = ctypes.c_size_t
     
     lib.meshopt_encodeIndexBuffer.argtypes = [
-        ctypes.POINTER(ctypes.c_ubyte), # buffer
+        _UBYTE_P,                       # buffer
         ctypes.c_size_t,                # buffer_size
-        ctypes.POINTER(ctypes.c_uint),  # indices
+        _UINT_P,                        # indices
         ctypes.c_size_t                 # index_count
     ]
     lib.meshopt_encodeIndexBuffer.restype = ctypes.c_size_t
@@ -160,9 +165,9 @@ def setup_function_signatures() -> None:
     lib.meshopt_encodeIndexSequenceBound.restype = ctypes.c_size_t
     
     lib.meshopt_encodeIndexSequence.argtypes = [
-        ctypes.POINTER(ctypes.c_ubyte), # buffer
+        _UBYTE_P,                       # buffer
         ctypes.c_size_t,                # buffer_size
-        ctypes.POINTER(ctypes.c_uint),  # indices
+        _UINT_P,                        # indices
         ctypes.c_size_t                 # index_count
     ]
     lib.meshopt_encodeIndexSequence.restype = ctypes.c_size_t
@@ -172,7 +177,7 @@ def setup_function_signatures() -> None:
         ctypes.c_void_p,                # destination
         ctypes.c_size_t,                # vertex_count
         ctypes.c_size_t,                # vertex_size
-        ctypes.POINTER(ctypes.c_ubyte), # buffer
+        _UBYTE_P,                       # buffer
         ctypes.c_size_t                 # buffer_size
     ]
     lib.meshopt_decodeVertexBuffer.restype = ctypes.c_int
@@ -181,7 +186,7 @@ def setup_function_signatures() -> None:
         ctypes.c_void_p,                # destination
         ctypes.c_size_t,                # index_count
         ctypes.c_size_t,                # index_size
-        ctypes.POINTER(ctypes.c_ubyte), # buffer
+        _UBYTE_P,                       # buffer
         ctypes.c_size_t                 # buffer_size
     ]
     lib.meshopt_decodeIndexBuffer.restype = ctypes.c_int
@@ -190,7 +195,7 @@ def setup_function_signatures() -> None:
         ctypes.c_void_p,                # destination
         ctypes.c_size_t,                # index_count
         ctypes.c_size_t,                # index_size
-        ctypes.POINTER(ctypes.c_ubyte), # buffer
+        _UBYTE_P,                       # buffer
         ctypes.c_size_t                 # buffer_size
     ]
     lib.meshopt_decodeIndexSequence.restype = ctypes.c_int
@@ -203,38 +208,38 @@ def setup_function_signatures() -> None:
     lib.meshopt_encodeIndexVersion.restype = None
     
     lib.meshopt_decodeVertexVersion.argtypes = [
-        ctypes.POINTER(ctypes.c_ubyte), # buffer
+        _UBYTE_P,                       # buffer
         ctypes.c_size_t                 # buffer_size
     ]
     lib.meshopt_decodeVertexVersion.restype = ctypes.c_int
     
     lib.meshopt_decodeIndexVersion.argtypes = [
-        ctypes.POINTER(ctypes.c_ubyte), # buffer
+        _UBYTE_P,                       # buffer
         ctypes.c_size_t                 # buffer_size
     ]
     lib.meshopt_decodeIndexVersion.restype = ctypes.c_int
     
     # Simplify sloppy
     lib.meshopt_simplifySloppy.argtypes = [
-        ctypes.POINTER(ctypes.c_uint),  # destination
-        ctypes.POINTER(ctypes.c_uint),  # indices
+        _UINT_P,                        # destination
+        _UINT_P,                        # indices
         ctypes.c_size_t,                # index_count
-        ctypes.POINTER(ctypes.c_float), # vertex_positions
+        _FLOAT_P,                       # vertex_positions
         ctypes.c_size_t,                # vertex_count
         ctypes.c_size_t,                # vertex_positions_stride
         ctypes.c_size_t,                # target_index_count
         ctypes.c_float,                 # target_error
-        ctypes.POINTER(ctypes.c_float)  # result_error
+        _FLOAT_P                        # result_error
     ]
     lib.meshopt_simplifySloppy.restype = ctypes.c_size_t
     
     # Simplify points
     lib.meshopt_simplifyPoints.argtypes = [
-        ctypes.POINTER(ctypes.c_uint),  # destination
-        ctypes.POINTER(ctypes.c_float), # vertex_positions
+        _UINT_P,                        # destination
+        _FLOAT_P,                       # vertex_positions
         ctypes.c_size_t,                # vertex_count
         ctypes.c_size_t,                # vertex_positions_stride
-        ctypes.POINTER(ctypes.c_float), # vertex_colors
+        _FLOAT_P,                       # vertex_colors
         ctypes.c_size_t,                # vertex_colors_stride
         ctypes.c_float,                 # color_weight
         ctypes.c_size_t                 # target_vertex_count
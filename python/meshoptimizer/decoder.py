@@ -4,11 +4,12 @@ Decoder functions for meshoptimizer.
 import ctypes
 from typing import Union
 import numpy as np
-from ._loader import lib
+from ._loader import lib, _UBYTE_P
 
 def decode_vertex_buffer(vertex_count: int, 
                         vertex_size: int, 
-                        buffer: Union[bytes, np.ndarray]) -> np.ndarray:
+                        buffer: Union[bytes, np.ndarray],
+                        dtype: np.dtype = np.float32) -> np.ndarray:
     """
     Decode vertex buffer data.
     
@@ -16,6 +17,7 @@ def decode_vertex_buffer(vertex_count: int,
         vertex_count: number of vertices
         vertex_size: size of each vertex in bytes
         buffer: encoded buffer as bytes
+        dtype: component type of the decoded data (default: float32)
         
     Returns:
         Numpy array containing the decoded vertex data
@@ -23,17 +25,22 @@ def decode_vertex_buffer(vertex_count: int,
     # Convert buffer to numpy array if it's not already
     buffer_array = np.frombuffer(buffer, dtype=np.uint8)
     
+    # Each vertex must hold a whole number of components, or the destination would be too small
+    dtype = np.dtype(dtype)
+    if vertex_size % dtype.itemsize != 0:
+        raise ValueError(f"Vertex size {vertex_size} is not a multiple of the {dtype} item size {dtype.itemsize}")
+    
     # Create destination array
-    # Calculate the number of float32 elements needed
-    float_count = vertex_count * vertex_size // 4
-    destination = np.zeros(float_count, dtype=np.float32)
+    # Calculate the number of components needed
+    component_count = vertex_count * vertex_size // dtype.itemsize
+    destination = np.empty(component_count, dtype=dtype)
     
     # Call C function
     result = lib.meshopt_decodeVertexBuffer(
         destination.ctypes.data_as(ctypes.c_void_p),
         vertex_count,
         vertex_size,
-        buffer_array.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+        buffer_array.ctypes.data_as(_UBYTE_P),
         len(buffer_array)
     )
     
@@ -41,7 +48,7 @@ def decode_vertex_buffer(vertex_count: int,
         raise RuntimeError(f"Failed to decode vertex buffer: error code {result}")
     
     # Reshape the array if vertex_size indicates multiple components per vertex
-    components_per_vertex = vertex_size // 4  # Assuming float32 (4 bytes) components
+    components_per_vertex = vertex_size // dtype.itemsize
     if components_per_vertex > 1:
         destination = destination.reshape(vertex_count, components_per_vertex)
     
@@ -59,20 +66,23 @@ def decode_index_buffer(index_count: int,
         buffer: encoded buffer as bytes
         
     Returns:
-        Numpy array containing the decoded index data
+        Numpy array containing the decoded index data (uint16 if index_size is 2, uint32 if it is 4)
     """
     # Convert buffer to numpy array if it's not already
     buffer_array = np.frombuffer(buffer, dtype=np.uint8)
     
-    # Create destination array
-    destination = np.zeros(index_count, dtype=np.uint32)
+    if index_size not in (2, 4):
+        raise ValueError("Index size must be 2 or 4")
+    
+    # Create destination array matching the requested index size
+    destination = np.empty(index_count, dtype=np.uint16 if index_size == 2 else np.uint32)
     
     # Call C function
     result = lib.meshopt_decodeIndexBuffer(
         destination.ctypes.data_as(ctypes.c_void_p),
         index_count,
         index_size,
-        buffer_array.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+        buffer_array.ctypes.data_as(_UBYTE_P),
         len(buffer_array)
     )
     
@@ -95,7 +105,7 @@ def decode_vertex_version(buffer: Union[bytes, np.ndarray]) -> int:
     buffer_array = np.frombuffer(buffer, dtype=np.uint8)
     
     return lib.meshopt_decodeVertexVersion(
-        buffer_array.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+        buffer_array.ctypes.data_as(_UBYTE_P),
         len(buffer_array)
     )
 
@@ -113,7 +123,7 @@ def decode_index_version(buffer: Union[bytes, np.ndarray]) -> int:
     buffer_array = np.frombuffer(buffer, dtype=np.uint8)
     
     return lib.meshopt_decodeIndexVersion(
-        buffer_array.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+        buffer_array.ctypes.data_as(_UBYTE_P),
         len(buffer_array)
     )
 
@@ -129,20 +139,23 @@ def decode_index_sequence(index_count: int,
         buffer: encoded buffer as bytes
         
     Returns:
-        Numpy array containing the decoded index data
+        Numpy array containing the decoded index data (uint16 if index_size is 2, uint32 if it is 4)
     """
     # Convert buffer to numpy array if it's not already
     buffer_array = np.frombuffer(buffer, dtype=np.uint8)
     
-    # Create destination array
-    destination = np.zeros(index_count, dtype=np.uint32)
+    if index_size not in (2, 4):
+        raise ValueError("Index size must be 2 or 4")
+    
+    # Create destination array matching the requested index size
+    destination = np.empty(index_count, dtype=np.uint16 if index_size == 2 else np.uint32)
     
     # Call C function
     result = lib.meshopt_decodeIndexSequence(
         destination.ctypes.data_as(ctypes.c_void_p),
         index_count,
         index_size,
-        buffer_array.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+        buffer_array.ctypes.data_as(_UBYTE_P),
         len(buffer_array)
     )
     
@@ -4,11 +4,13 @@ Encoder functions for meshoptimizer.
 import ctypes
 from typing import Optional
 import numpy as np
-from ._loader import lib
+from ._loader import lib, _UINT_P
+from .utils import _vertex_size
 
 def encode_vertex_buffer(vertices: np.ndarray, 
                         vertex_count: Optional[int] = None, 
-                        vertex_size: Optional[int] = None) -> bytes:
+                        vertex_size: Optional[int] = None,
+                        keep_dtype: bool = False) -> bytes:
     """
     Encode vertex buffer data.
     
@@ -16,29 +18,50 @@ def encode_vertex_buffer(vertices: np.ndarray,
         vertices: numpy array of vertex data
         vertex_count: number of vertices (optional, derived from vertices if not provided)
         vertex_size: size of each vertex in bytes (optional, derived from vertices if not provided)
+        keep_dtype: encode integer and floating point data in its native layout instead of converting it to float32 (default: False)
         
     Returns:
         Encoded buffer as bytes
+        
+    By default vertex data is converted to float32 before encoding. With
+    keep_dtype=True, integer and floating point data is encoded as-is (other
+    types raise ValueError); each vertex must then be a multiple of 4 bytes and
+    at most 256 bytes, and the same dtype has to be passed to
+    decode_vertex_buffer to get it back. Non-contiguous arrays (e.g.
+    column slices of a wider vertex buffer) are copied into a contiguous buffer
+    first.
     """
-    # Convert vertices to numpy array if it's not already
-    vertices = np.asarray(vertices, dtype=np.float32)
+    # Convert vertices to a contiguous numpy array if it's not already
+    if not keep_dtype:
+        vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+    else:
+        vertices = np.ascontiguousarray(vertices)
+        if vertices.dtype.kind not in 'iuf':
+            raise ValueError(f"Vertex data of type {vertices.dtype} can't be encoded with keep_dtype=True")
+        
+        # The data is passed through as-is, so its layout has to be one the codec accepts
+        native_size = _vertex_size(vertices)
+        if native_size % 4 != 0 or native_size > 256:
+            raise ValueError(f"Vertex size {native_size} must be a multiple of 4 and at most 256 bytes")
+        if vertex_size not in (None, native_size):
+            raise ValueError(f"Vertex size {vertex_size} does not match the {vertices.dtype} vertex layout ({native_size} bytes)")
     
     # Derive vertex_count and vertex_size if not provided
     if vertex_count is None:
         vertex_count = len(vertices)
     
     if vertex_size is None:
-        vertex_size = vertices.itemsize * vertices.shape[1] if len(vertices.shape) > 1 else vertices.itemsize
+        vertex_size = _vertex_size(vertices)
     
     # Calculate buffer size
     bound = lib.meshopt_encodeVertexBufferBound(vertex_count, vertex_size)
     
     # Allocate buffer
-    buffer = np.zeros(bound, dtype=np.uint8)
+    buffer = (ctypes.c_ubyte * bound)()
     
     # Call C function
     result_size = lib.meshopt_encodeVertexBuffer(
-        buffer.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+        buffer,
         bound,
         vertices.ctypes.data_as(ctypes.c_void_p),
         vertex_count,
@@ -48,8 +71,8 @@ def encode_vertex_buffer(vertices: np.ndarray,
     if result_size == 0:
         raise RuntimeError("Failed to encode vertex buffer")
     
-    # Return only the used portion of the buffer
-    return bytes(buffer[:result_size])
+    # Copy only the used portion of the buffer into the result
+    return ctypes.string_at(buffer, result_size)
 
 def encode_index_buffer(indices: np.ndarray, 
                        index_count: Optional[int] = None, 
@@ -65,8 +88,8 @@ def encode_index_buffer(indices: np.ndarray,
     Returns:
         Encoded buffer as bytes
     """
-    # Convert indices to numpy array if it's not already
-    indices = np.asarray(indices, dtype=np.uint32)
+    # Convert indices to a contiguous numpy array if it's not already
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
     
     # Derive index_count if not provided
     if index_count is None:
@@ -74,27 +97,27 @@ def encode_index_buffer(indices: np.ndarray,
     
     # Derive vertex_count if not provided
     if vertex_count is None:
-        vertex_count = np.max(indices) + 1
+        vertex_count = int(indices.max()) + 1
     
     # Calculate buffer size
     bound = lib.meshopt_encodeIndexBufferBound(index_count, vertex_count)
     
     # Allocate buffer
-    buffer = np.zeros(bound, dtype=np.uint8)
+    buffer = (ctypes.c_ubyte * bound)()
     
     # Call C function
     result_size = lib.meshopt_encodeIndexBuffer(
-        buffer.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+        buffer,
         bound,
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
+        indices.ctypes.data_as(_UINT_P),
         index_count
     )
     
     if result_size == 0:
         raise RuntimeError("Failed to encode index buffer")
     
-    # Return only the used portion of the buffer
-    return bytes(buffer[:result_size])
+    # Copy only the used portion of the buffer into the result
+    return ctypes.string_at(buffer, result_size)
 
 def encode_vertex_version(version: int) -> None:
     """
@@ -134,8 +157,8 @@ def encode_index_sequence(indices: np.ndarray,
     Returns:
         Encoded buffer as bytes
     """
-    # Convert indices to numpy array if it's not already
-    indices = np.asarray(indices, dtype=np.uint32)
+    # Convert indices to a contiguous numpy array if it's not already
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
     
     # Derive index_count if not provided
     if index_count is None:
@@ -143,24 +166,24 @@ def encode_index_sequence(indices: np.ndarray,
     
     # Derive vertex_count if not provided
     if vertex_count is None:
-        vertex_count = np.max(indices) + 1
+        vertex_count = int(indices.max()) + 1
     
     # Calculate buffer size
     bound = lib.meshopt_encodeIndexSequenceBound(index_count, vertex_count)
     
     # Allocate buffer
-    buffer = np.zeros(bound, dtype=np.uint8)
+    buffer = (ctypes.c_ubyte * bound)()
     
     # Call C function
     result_size = lib.meshopt_encodeIndexSequence(
-        buffer.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+        buffer,
         bound,
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
+        indices.ctypes.data_as(_UINT_P),
         index_count
     )
     
     if result_size == 0:
         raise RuntimeError("Failed to encode index sequence")
     
-    # Return only the used portion of the buffer
-    return bytes(buffer[:result_size])
\ No newline at end of file
+    # Copy only the used portion of the buffer into the result
+    return ctypes.string_at(buffer, result_size)
\ No newline at end of file
@@ -4,7 +4,8 @@ Optimization functions for meshoptimizer.
 import ctypes
 from typing import Optional, Union, Tuple
 import numpy as np
-from ._loader import lib
+from ._loader import lib, _UINT_P, _FLOAT_P
+from .utils import _vertex_size
 
 def optimize_vertex_cache(destination: np.ndarray, indices: np.ndarray, 
                          index_count: Optional[int] = None, 
@@ -21,8 +22,8 @@ def optimize_vertex_cache(destination: np.ndarray, indices: np.ndarray,
     Returns:
         None (destination is modified in-place)
     """
-    # Convert indices to numpy array if it's not already
-    indices = np.asarray(indices, dtype=np.uint32)
+    # Convert indices to a contiguous numpy array if it's not already
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
     
     # Derive index_count if not provided
     if index_count is None:
@@ -30,12 +31,12 @@ def optimize_vertex_cache(destination: np.ndarray, indices: np.ndarray,
     
     # Derive vertex_count if not provided
     if vertex_count is None:
-        vertex_count = np.max(indices) + 1
+        vertex_count = int(indices.max()) + 1
     
     # Call C function
     lib.meshopt_optimizeVertexCache(
-        destination.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
+        destination.ctypes.data_as(_UINT_P),
+        indices.ctypes.data_as(_UINT_P),
         index_count,
         vertex_count
     )
@@ -55,8 +56,8 @@ def optimize_vertex_cache_strip(destination: np.ndarray, indices: np.ndarray,
     Returns:
         None (destination is modified in-place)
     """
-    # Convert indices to numpy array if it's not already
-    indices = np.asarray(indices, dtype=np.uint32)
+    # Convert indices to a contiguous numpy array if it's not already
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
     
     # Derive index_count if not provided
     if index_count is None:
@@ -64,12 +65,12 @@ def optimize_vertex_cache_strip(destination: np.ndarray, indices: np.ndarray,
     
     # Derive vertex_count if not provided
     if vertex_count is None:
-        vertex_count = np.max(indices) + 1
+        vertex_count = int(indices.max()) + 1
     
     # Call C function
     lib.meshopt_optimizeVertexCacheStrip(
-        destination.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
+        destination.ctypes.data_as(_UINT_P),
+        indices.ctypes.data_as(_UINT_P),
         index_count,
         vertex_count
     )
@@ -91,8 +92,8 @@ def optimize_vertex_cache_fifo(destination: np.ndarray, indices: np.ndarray,
     Returns:
         None (destination is modified in-place)
     """
-    # Convert indices to numpy array if it's not already
-    indices = np.asarray(indices, dtype=np.uint32)
+    # Convert indices to a contiguous numpy array if it's not already
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
     
     # Derive index_count if not provided
     if index_count is None:
@@ -100,12 +101,12 @@ def optimize_vertex_cache_fifo(destination: np.ndarray, indices: np.ndarray,
     
     # Derive vertex_count if not provided
     if vertex_count is None:
-        vertex_count = np.max(indices) + 1
+        vertex_count = int(indices.max()) + 1
     
     # Call C function
     lib.meshopt_optimizeVertexCacheFifo(
-        destination.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
+        destination.ctypes.data_as(_UINT_P),
+        indices.ctypes.data_as(_UINT_P),
         index_count,
         vertex_count,
         cache_size
@@ -132,11 +133,11 @@ def optimize_overdraw(destination: np.ndarray, indices: np.ndarray,
     Returns:
         None (destination is modified in-place)
     """
-    # Convert indices to numpy array if it's not already
-    indices = np.asarray(indices, dtype=np.uint32)
+    # Convert indices to a contiguous numpy array if it's not already
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
     
-    # Convert vertex_positions to numpy array if it's not already
-    vertex_positions = np.asarray(vertex_positions, dtype=np.float32)
+    # Convert vertex_positions to a contiguous numpy array if it's not already
+    vertex_positions = np.ascontiguousarray(vertex_positions, dtype=np.float32)
     
     # Derive index_count if not provided
     if index_count is None:
@@ -148,14 +149,14 @@ def optimize_overdraw(destination: np.ndarray, indices: np.ndarray,
     
     # Derive vertex_positions_stride if not provided
     if vertex_positions_stride is None:
-        vertex_positions_stride = vertex_positions.itemsize * vertex_positions.shape[1] if len(vertex_positions.shape) > 1 else vertex_positions.itemsize
+        vertex_positions_stride = _vertex_size(vertex_positions)
     
     # Call C function
     lib.meshopt_optimizeOverdraw(
-        destination.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
+        destination.ctypes.data_as(_UINT_P),
+        indices.ctypes.data_as(_UINT_P),
         index_count,
-        vertex_positions.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+        vertex_positions.ctypes.data_as(_FLOAT_P),
         vertex_count,
         vertex_positions_stride,
         threshold
@@ -171,7 +172,9 @@ def optimize_vertex_fetch(destination_vertices: np.ndarray, indices: np.ndarray,
     
     Args:
         destination_vertices: numpy array to store the optimized vertices
-        indices: numpy array of index data
+        indices: numpy array of index data; remapped in place to the new vertex order if it is a
+            C-contiguous uint32 array (which must then be writeable), otherwise a converted copy is remapped
+            and the caller's array is unchanged
         source_vertices: numpy array of vertex data
         index_count: number of indices (optional, derived from indices if not provided)
         vertex_count: number of vertices (optional, derived from source_vertices if not provided)
@@ -180,11 +183,15 @@ def optimize_vertex_fetch(destination_vertices: np.ndarray, indices: np.ndarray,
     Returns:
         Number of unique vertices
     """
-    # Convert indices to numpy array if it's not already
-    indices = np.asarray(indices, dtype=np.uint32)
+    # Convert indices to a contiguous numpy array if it's not already
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
+    
+    # The C function remaps indices in place and ignores numpy's read-only flag
+    if not indices.flags.writeable:
+        raise ValueError("Indices must be writeable, as they are remapped in place")
     
-    # Convert source_vertices to numpy array if it's not already
-    source_vertices = np.asarray(source_vertices)
+    # Convert source_vertices to a contiguous numpy array if it's not already
+    source_vertices = np.ascontiguousarray(source_vertices)
     
     # Derive index_count if not provided
     if index_count is None:
@@ -196,12 +203,12 @@ def optimize_vertex_fetch(destination_vertices: np.ndarray, indices: np.ndarray,
     
     # Derive vertex_size if not provided
     if vertex_size is None:
-        vertex_size = source_vertices.itemsize * source_vertices.shape[1] if len(source_vertices.shape) > 1 else source_vertices.itemsize
+        vertex_size = _vertex_size(source_vertices)
     
     # Call C function
     result = lib.meshopt_optimizeVertexFetch(
         destination_vertices.ctypes.data_as(ctypes.c_void_p),
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
+        indices.ctypes.data_as(_UINT_P),
         index_count,
         source_vertices.ctypes.data_as(ctypes.c_void_p),
         vertex_count,
@@ -225,8 +232,8 @@ def optimize_vertex_fetch_remap(destination: np.ndarray, indices: np.ndarray,
     Returns:
         Number of unique vertices
     """
-    # Convert indices to numpy array if it's not already
-    indices = np.asarray(indices, dtype=np.uint32)
+    # Convert indices to a contiguous numpy array if it's not already
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
     
     # Derive index_count if not provided
     if index_count is None:
@@ -234,12 +241,12 @@ def optimize_vertex_fetch_remap(destination: np.ndarray, indices: np.ndarray,
     
     # Derive vertex_count if not provided
     if vertex_count is None:
-        vertex_count = np.max(indices) + 1
+        vertex_count = int(indices.max()) + 1
     
     # Call C function
     result = lib.meshopt_optimizeVertexFetchRemap(
-        destination.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
+        destination.ctypes.data_as(_UINT_P),
+        indices.ctypes.data_as(_UINT_P),
         index_count,
         vertex_count
     )
@@ -4,7 +4,8 @@ Simplification functions for meshoptimizer.
 import ctypes
 from typing import Optional
 import numpy as np
-from ._loader import lib
+from ._loader import lib, _UBYTE_P, _UINT_P, _FLOAT_P
+from .utils import _vertex_size
 
 # Simplification options
 SIMPLIFY_LOCK_BORDER = 1 << 0
@@ -35,11 +36,11 @@ def simplify(destination: np.ndarray, indices: np.ndarray, vertex_positions: np.
     Returns:
         Number of indices in the simplified mesh
     """
-    # Convert indices to numpy array if it's not already
-    indices = np.asarray(indices, dtype=np.uint32)
+    # Convert indices to a contiguous numpy array if it's not already
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
     
-    # Convert vertex_positions to numpy array if it's not already
-    vertex_positions = np.asarray(vertex_positions, dtype=np.float32)
+    # Convert vertex_positions to a contiguous numpy array if it's not already
+    vertex_positions = np.ascontiguousarray(vertex_positions, dtype=np.float32)
     
     # Derive index_count if not provided
     if index_count is None:
@@ -51,7 +52,7 @@ def simplify(destination: np.ndarray, indices: np.ndarray, vertex_positions: np.
     
     # Derive vertex_positions_stride if not provided
     if vertex_positions_stride is None:
-        vertex_positions_stride = vertex_positions.itemsize * vertex_positions.shape[1] if len(vertex_positions.shape) > 1 else vertex_positions.itemsize
+        vertex_positions_stride = _vertex_size(vertex_positions)
     
     # Derive target_index_count if not provided
     if target_index_count is None:
@@ -61,14 +62,14 @@ def simplify(destination: np.ndarray, indices: np.ndarray, vertex_positions: np.
     if result_error is not None:
         result_error_ptr = ctypes.pointer(ctypes.c_float(0.0))
     else:
-        result_error_ptr = ctypes.POINTER(ctypes.c_float)()
+        result_error_ptr = _FLOAT_P()
     
     # Call C function
     result = lib.meshopt_simplify(
-        destination.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
+        destination.ctypes.data_as(_UINT_P),
+        indices.ctypes.data_as(_UINT_P),
         index_count,
-        vertex_positions.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+        vertex_positions.ctypes.data_as(_FLOAT_P),
         vertex_count,
         vertex_positions_stride,
         target_index_count,
@@ -116,17 +117,17 @@ def simplify_with_attributes(destination: np.ndarray, indices: np.ndarray, verte
     Returns:
         Number of indices in the simplified mesh
     """
-    # Convert indices to numpy array if it's not already
-    indices = np.asarray(indices, dtype=np.uint32)
+    # Convert indices to a contiguous numpy array if it's not already
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
     
-    # Convert vertex_positions to numpy array if it's not already
-    vertex_positions = np.asarray(vertex_positions, dtype=np.float32)
+    # Convert vertex_positions to a contiguous numpy array if it's not already
+    vertex_positions = np.ascontiguousarray(vertex_positions, dtype=np.float32)
     
-    # Convert vertex_attributes to numpy array if it's not already
-    vertex_attributes = np.asarray(vertex_attributes, dtype=np.float32)
+    # Convert vertex_attributes to a contiguous numpy array if it's not already
+    vertex_attributes = np.ascontiguousarray(vertex_attributes, dtype=np.float32)
     
-    # Convert attribute_weights to numpy array if it's not already
-    attribute_weights = np.asarray(attribute_weights, dtype=np.float32)
+    # Convert attribute_weights to a contiguous numpy array if it's not already
+    attribute_weights = np.ascontiguousarray(attribute_weights, dtype=np.float32)
     
     # Derive index_count if not provided
     if index_count is None:
@@ -138,11 +139,11 @@ def simplify_with_attributes(destination: np.ndarray, indices: np.ndarray, verte
     
     # Derive vertex_positions_stride if not provided
     if vertex_positions_stride is None:
-        vertex_positions_stride = vertex_positions.itemsize * vertex_positions.shape[1] if len(vertex_positions.shape) > 1 else vertex_positions.itemsize
+        vertex_positions_stride = _vertex_size(vertex_positions)
     
     # Derive vertex_attributes_stride if not provided
     if vertex_attributes_stride is None:
-        vertex_attributes_stride = vertex_attributes.itemsize * vertex_attributes.shape[1] if len(vertex_attributes.shape) > 1 else vertex_attributes.itemsize
+        vertex_attributes_stride = _vertex_size(vertex_attributes)
     
     # Derive attribute_count if not provided
     if attribute_count is None:
@@ -156,26 +157,26 @@ def simplify_with_attributes(destination: np.ndarray, indices: np.ndarray, verte
     if result_error is not None:
         result_error_ptr = ctypes.pointer(ctypes.c_float(0.0))
     else:
-        result_error_ptr = ctypes.POINTER(ctypes.c_float)()
+        result_error_ptr = _FLOAT_P()
     
     # Create vertex_lock_ptr if vertex_lock is provided
     if vertex_lock is not None:
-        vertex_lock = np.asarray(vertex_lock, dtype=np.uint8)
-        vertex_lock_ptr = vertex_lock.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte))
+        vertex_lock = np.ascontiguousarray(vertex_lock, dtype=np.uint8)
+        vertex_lock_ptr = vertex_lock.ctypes.data_as(_UBYTE_P)
     else:
-        vertex_lock_ptr = ctypes.POINTER(ctypes.c_ubyte)()
+        vertex_lock_ptr = _UBYTE_P()
     
     # Call C function
     result = lib.meshopt_simplifyWithAttributes(
-        destination.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
+        destination.ctypes.data_as(_UINT_P),
+        indices.ctypes.data_as(_UINT_P),
         index_count,
-        vertex_positions.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+        vertex_positions.ctypes.data_as(_FLOAT_P),
         vertex_count,
         vertex_positions_stride,
-        vertex_attributes.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+        vertex_attributes.ctypes.data_as(_FLOAT_P),
         vertex_attributes_stride,
-        attribute_weights.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+        attribute_weights.ctypes.data_as(_FLOAT_P),
         attribute_count,
         vertex_lock_ptr,
         target_index_count,
@@ -212,11 +213,11 @@ def simplify_sloppy(destination: np.ndarray, indices: np.ndarray, vertex_positio
     Returns:
         Number of indices in the simplified mesh
     """
-    # Convert indices to numpy array if it's not already
-    indices = np.asarray(indices, dtype=np.uint32)
+    # Convert indices to a contiguous numpy array if it's not already
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
     
-    # Convert vertex_positions to numpy array if it's not already
-    vertex_positions = np.asarray(vertex_positions, dtype=np.float32)
+    # Convert vertex_positions to a contiguous numpy array if it's not already
+    vertex_positions = np.ascontiguousarray(vertex_positions, dtype=np.float32)
     
     # Derive index_count if not provided
     if index_count is None:
@@ -228,7 +229,7 @@ def simplify_sloppy(destination: np.ndarray, indices: np.ndarray, vertex_positio
     
     # Derive vertex_positions_stride if not provided
     if vertex_positions_stride is None:
-        vertex_positions_stride = vertex_positions.itemsize * vertex_positions.shape[1] if len(vertex_positions.shape) > 1 else vertex_positions.itemsize
+        vertex_positions_stride = _vertex_size(vertex_positions)
     
     # Derive target_index_count if not provided
     if target_index_count is None:
@@ -238,14 +239,14 @@ def simplify_sloppy(destination: np.ndarray, indices: np.ndarray, vertex_positio
     if result_error is not None:
         result_error_ptr = ctypes.pointer(ctypes.c_float(0.0))
     else:
-        result_error_ptr = ctypes.POINTER(ctypes.c_float)()
+        result_error_ptr = _FLOAT_P()
     
     # Call C function
     result = lib.meshopt_simplifySloppy(
-        destination.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
+        destination.ctypes.data_as(_UINT_P),
+        indices.ctypes.data_as(_UINT_P),
         index_count,
-        vertex_positions.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+        vertex_positions.ctypes.data_as(_FLOAT_P),
         vertex_count,
         vertex_positions_stride,
         target_index_count,
@@ -282,8 +283,8 @@ def simplify_points(destination: np.ndarray, vertex_positions: np.ndarray,
     Returns:
         Number of vertices in the simplified point cloud
     """
-    # Convert vertex_positions to numpy array if it's not already
-    vertex_positions = np.asarray(vertex_positions, dtype=np.float32)
+    # Convert vertex_positions to a contiguous numpy array if it's not already
+    vertex_positions = np.ascontiguousarray(vertex_positions, dtype=np.float32)
     
     # Derive vertex_count if not provided
     if vertex_count is None:
@@ -291,7 +292,7 @@ def simplify_points(destination: np.ndarray, vertex_positions: np.ndarray,
     
     # Derive vertex_positions_stride if not provided
     if vertex_positions_stride is None:
-        vertex_positions_stride = vertex_positions.itemsize * vertex_positions.shape[1] if len(vertex_positions.shape) > 1 else vertex_positions.itemsize
+        vertex_positions_stride = _vertex_size(vertex_positions)
     
     # Derive target_vertex_count if not provided
     if target_vertex_count is None:
@@ -299,21 +300,21 @@ def simplify_points(destination: np.ndarray, vertex_positions: np.ndarray,
     
     # Handle vertex_colors
     if vertex_colors is not None:
-        vertex_colors = np.asarray(vertex_colors, dtype=np.float32)
+        vertex_colors = np.ascontiguousarray(vertex_colors, dtype=np.float32)
         
         # Derive vertex_colors_stride if not provided
         if vertex_colors_stride is None:
-            vertex_colors_stride = vertex_colors.itemsize * vertex_colors.shape[1] if len(vertex_colors.shape) > 1 else vertex_colors.itemsize
+            vertex_colors_stride = _vertex_size(vertex_colors)
         
-        vertex_colors_ptr = vertex_colors.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
+        vertex_colors_ptr = vertex_colors.ctypes.data_as(_FLOAT_P)
     else:
-        vertex_colors_ptr = ctypes.POINTER(ctypes.c_float)()
+        vertex_colors_ptr = _FLOAT_P()
         vertex_colors_stride = 0
     
     # Call C function
     result = lib.meshopt_simplifyPoints(
-        destination.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
-        vertex_positions.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+        destination.ctypes.data_as(_UINT_P),
+        vertex_positions.ctypes.data_as(_FLOAT_P),
         vertex_count,
         vertex_positions_stride,
         vertex_colors_ptr,
@@ -338,8 +339,8 @@ def simplify_scale(vertex_positions: np.ndarray,
     Returns:
         Scale factor for simplification error
     """
-    # Convert vertex_positions to numpy array if it's not already
-    vertex_positions = np.asarray(vertex_positions, dtype=np.float32)
+    # Convert vertex_positions to a contiguous numpy array if it's not already
+    vertex_positions = np.ascontiguousarray(vertex_positions, dtype=np.float32)
     
     # Derive vertex_count if not provided
     if vertex_count is None:
@@ -347,11 +348,11 @@ def simplify_scale(vertex_positions: np.ndarray,
     
     # Derive vertex_positions_stride if not provided
     if vertex_positions_stride is None:
-        vertex_positions_stride = vertex_positions.itemsize * vertex_positions.shape[1] if len(vertex_positions.shape) > 1 else vertex_positions.itemsize
+        vertex_positions_stride = _vertex_size(vertex_positions)
     
     # Call C function
     result = lib.meshopt_simplifyScale(
-        vertex_positions.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+        vertex_positions.ctypes.data_as(_FLOAT_P),
         vertex_count,
         vertex_positions_stride
     )
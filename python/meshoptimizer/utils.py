@@ -4,7 +4,11 @@ Utility functions for meshoptimizer.
 import ctypes
 from typing import Optional
 import numpy as np
-from ._loader import lib
+from ._loader import lib, _UINT_P
+
+def _vertex_size(vertices: np.ndarray) -> int:
+    """Get the size of a single vertex (row) of a vertex array in bytes."""
+    return vertices.itemsize * (vertices.shape[1] if vertices.ndim > 1 else 1)
 
 def generate_vertex_remap(destination: np.ndarray, 
                          indices: Optional[np.ndarray] = None, 
@@ -26,9 +30,9 @@ def generate_vertex_remap(destination: np.ndarray,
     Returns:
         Number of unique vertices
     """
-    # Convert indices to numpy array if it's not already and not None
+    # Convert indices to a contiguous numpy array if it's not already and not None
     if indices is not None:
-        indices = np.asarray(indices, dtype=np.uint32)
+        indices = np.ascontiguousarray(indices, dtype=np.uint32)
         
         # Derive index_count if not provided
         if index_count is None:
@@ -37,9 +41,9 @@ def generate_vertex_remap(destination: np.ndarray,
         # If indices is None, index_count must be 0
         index_count = 0
     
-    # Convert vertices to numpy array if it's not already
+    # Convert vertices to a contiguous numpy array if it's not already
     if vertices is not None:
-        vertices = np.asarray(vertices)
+        vertices = np.ascontiguousarray(vertices)
         
         # Derive vertex_count if not provided
         if vertex_count is None:
@@ -47,12 +51,12 @@ def generate_vertex_remap(destination: np.ndarray,
         
         # Derive vertex_size if not provided
         if vertex_size is None:
-            vertex_size = vertices.itemsize * vertices.shape[1] if len(vertices.shape) > 1 else vertices.itemsize
+            vertex_size = _vertex_size(vertices)
     
     # Call C function
     result = lib.meshopt_generateVertexRemap(
-        destination.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)) if indices is not None else None,
+        destination.ctypes.data_as(_UINT_P),
+        indices.ctypes.data_as(_UINT_P) if indices is not None else None,
         index_count,
         vertices.ctypes.data_as(ctypes.c_void_p) if vertices is not None else None,
         vertex_count,
@@ -79,8 +83,8 @@ def remap_vertex_buffer(destination: np.ndarray,
     Returns:
         None (destination is modified in-place)
     """
-    # Convert vertices to numpy array if it's not already
-    vertices = np.asarray(vertices)
+    # Convert vertices to a contiguous numpy array if it's not already
+    vertices = np.ascontiguousarray(vertices)
     
     # Derive vertex_count if not provided
     if vertex_count is None:
@@ -88,11 +92,11 @@ def remap_vertex_buffer(destination: np.ndarray,
     
     # Derive vertex_size if not provided
     if vertex_size is None:
-        vertex_size = vertices.itemsize * vertices.shape[1] if len(vertices.shape) > 1 else vertices.itemsize
+        vertex_size = _vertex_size(vertices)
     
-    # Convert remap to numpy array if it's not already and not None
+    # Convert remap to a contiguous numpy array if it's not already and not None
     if remap is not None:
-        remap = np.asarray(remap, dtype=np.uint32)
+        remap = np.ascontiguousarray(remap, dtype=np.uint32)
     
     # Call C function
     lib.meshopt_remapVertexBuffer(
@@ -100,7 +104,7 @@ def remap_vertex_buffer(destination: np.ndarray,
         vertices.ctypes.data_as(ctypes.c_void_p),
         vertex_count,
         vertex_size,
-        remap.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)) if remap is not None else None
+        remap.ctypes.data_as(_UINT_P) if remap is not None else None
     )
 
 def remap_index_buffer(destination: np.ndarray, 
@@ -119,21 +123,21 @@ def remap_index_buffer(destination: np.ndarray,
     Returns:
         None (destination is modified in-place)
     """
-    # Convert indices to numpy array if it's not already
-    indices = np.asarray(indices, dtype=np.uint32)
+    # Convert indices to a contiguous numpy array if it's not already
+    indices = np.ascontiguousarray(indices, dtype=np.uint32)
     
     # Derive index_count if not provided
     if index_count is None:
         index_count = len(indices)
     
-    # Convert remap to numpy array if it's not already and not None
+    # Convert remap to a contiguous numpy array if it's not already and not None
     if remap is not None:
-        remap = np.asarray(remap, dtype=np.uint32)
+        remap = np.ascontiguousarray(remap, dtype=np.uint32)
     
     # Call C function
     lib.meshopt_remapIndexBuffer(
-        destination.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
-        indices.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)),
+        destination.ctypes.data_as(_UINT_P),
+        indices.ctypes.data_as(_UINT_P),
         index_count,
-        remap.ctypes.data_as(ctypes.POINTER(ctypes.c_uint)) if remap is not None else None
+        remap.ctypes.data_as(_UINT_P) if remap is not None else None
     )
\ No newline at end of file
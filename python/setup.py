@@ -138,6 +138,8 @@ def generate_module_file():
 def get_build_args():
     is_windows = platform.system() == 'Windows'
     is_macos = platform.system() == 'Darwin'
+    # Target the build machine's instruction set; opt-in so that wheels remain portable
+    is_native = os.environ.get('MESHOPT_NATIVE') == '1'
     
     extra_compile_args = []
     extra_link_args = []
@@ -151,6 +153,8 @@ def get_build_args():
     if is_windows:
         # Windows-specific flags (MSVC)
         extra_compile_args = ['/std:c++14', '/O2', '/EHsc']
+        if is_native:
+            extra_compile_args.append('/arch:AVX2')
         # Export functions for DLL
         define_macros.extend([
             ('MESHOPTIMIZER_API', '__declspec(dllexport)'),
@@ -160,6 +164,8 @@ def get_build_args():
     else:
         # Unix-like systems (Linux/Mac)
         extra_compile_args = ['-std=c++11', '-O3', '-fPIC']
+        if is_native:
+            extra_compile_args.append('-march=native')
         if is_macos:
             extra_compile_args.extend(['-stdlib=libc++', '-mmacosx-version-min=10.9'])
     
@@ -12,50 +12,58 @@ from meshoptimizer import (
     encode_index_sequence, decode_index_sequence
 )
 
+# A simple mesh (a cube), shared read-only by all tests
+_CUBE_VERTICES = np.array([
+    # positions          
+    [-0.5, -0.5, -0.5],
+    [0.5, -0.5, -0.5],
+    [0.5, 0.5, -0.5],
+    [-0.5, 0.5, -0.5],
+    [-0.5, -0.5, 0.5],
+    [0.5, -0.5, 0.5],
+    [0.5, 0.5, 0.5],
+    [-0.5, 0.5, 0.5]
+], dtype=np.float32)
+
+_CUBE_INDICES = np.array([
+    0, 1, 2, 2, 3, 0,  # front
+    1, 5, 6, 6, 2, 1,  # right
+    5, 4, 7, 7, 6, 5,  # back
+    4, 0, 3, 3, 7, 4,  # left
+    3, 2, 6, 6, 7, 3,  # top
+    4, 5, 1, 1, 0, 4   # bottom
+], dtype=np.uint32)
+
+_CUBE_VERTICES.setflags(write=False)
+_CUBE_INDICES.setflags(write=False)
+
+
 class TestEncoding(unittest.TestCase):
     """Test encoding and decoding functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        # Create a simple mesh (a cube)
-        self.vertices = np.array([
-            # positions          
-            [-0.5, -0.5, -0.5],
-            [0.5, -0.5, -0.5],
-            [0.5, 0.5, -0.5],
-            [-0.5, 0.5, -0.5],
-            [-0.5, -0.5, 0.5],
-            [0.5, -0.5, 0.5],
-            [0.5, 0.5, 0.5],
-            [-0.5, 0.5, 0.5]
-        ], dtype=np.float32)
-
-        self.indices = np.array([
-            0, 1, 2, 2, 3, 0,  # front
-            1, 5, 6, 6, 2, 1,  # right
-            5, 4, 7, 7, 6, 5,  # back
-            4, 0, 3, 3, 7, 4,  # left
-            3, 2, 6, 6, 7, 3,  # top
-            4, 5, 1, 1, 0, 4   # bottom
-        ], dtype=np.uint32)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data shared by all tests."""
+        # Use a simple mesh (a cube)
+        cls.vertices = _CUBE_VERTICES
+        cls.indices = _CUBE_INDICES
+        cls.original_triangles = cls.get_triangles_set(cls.vertices, cls.indices)
         
     
-    def get_triangles_set(self, vertices, indices):
+    @staticmethod
+    def get_triangles_set(vertices, indices):
         """
         Get a set of triangles from vertices and indices.
-        Each triangle is represented as a frozenset of tuples of vertex coordinates.
-        This makes the comparison invariant to vertex order within triangles.
+        Each triangle is represented as the bytes of its vertex coordinates, with
+        the three vertices sorted. This makes the comparison invariant to vertex
+        order within triangles.
         """
-        triangles = set()
-        for i in range(0, len(indices), 3):
-            # Get the three vertices of the triangle
-            v1 = tuple(vertices[indices[i]])
-            v2 = tuple(vertices[indices[i+1]])
-            v3 = tuple(vertices[indices[i+2]])
-            # Create a frozenset of the vertices (order-invariant)
-            triangle = frozenset([v1, v2, v3])
-            triangles.add(triangle)
-        return triangles
+        # View each vertex as a single opaque value so that it can be sorted as a whole
+        vertices = np.ascontiguousarray(vertices)
+        vertex_keys = vertices.view(np.dtype((np.void, vertices.itemsize * vertices.shape[1]))).ravel()
+        # Gather the vertices of every triangle and sort them (order-invariant)
+        triangles = np.sort(vertex_keys[indices].reshape(-1, 3), axis=1)
+        return set(map(bytes, triangles))
     
     def test_encode_decode_vertices(self):
         """Test that encoding and decoding vertices preserves the data."""
@@ -73,9 +81,95 @@ class TestEncoding(unittest.TestCase):
             encoded_vertices
         )
         
-        # Check that the decoded vertices match the original
-        np.testing.assert_array_almost_equal(self.vertices, decoded_vertices)
-    
+        # Check that the decoded vertices match the original (the codec is lossless)
+        np.testing.assert_array_equal(self.vertices, decoded_vertices)
+
+    def test_encode_decode_non_contiguous_vertices(self):
+        """Test that non-contiguous vertex views are encoded correctly."""
+        # Interleave positions with another attribute and take a column slice
+        interleaved = np.hstack([self.vertices, np.ones_like(self.vertices)])
+        positions = interleaved[:, :3]
+        self.assertFalse(positions.flags.c_contiguous)
+
+        encoded_vertices = encode_vertex_buffer(positions)
+        decoded_vertices = decode_vertex_buffer(len(positions), 12, encoded_vertices)
+
+        np.testing.assert_array_equal(self.vertices, decoded_vertices)
+
+    def test_encode_decode_integer_vertices(self):
+        """Test that integer vertices are encoded without conversion to float32."""
+        # Quantize positions to 16-bit integers, padded to 4 components (8 bytes per vertex)
+        quantized = np.zeros((len(self.vertices), 4), dtype=np.int16)
+        quantized[:, :3] = np.round(self.vertices * 32767)
+
+        # Encode vertices; vertex size is derived from the native layout
+        encoded_vertices = encode_vertex_buffer(quantized, keep_dtype=True)
+
+        # Decode vertices back into the original integer type
+        decoded_vertices = decode_vertex_buffer(len(quantized), 8, encoded_vertices, np.int16)
+
+        self.assertEqual(decoded_vertices.dtype, np.int16)
+        np.testing.assert_array_equal(quantized, decoded_vertices)
+
+        # Dequantized positions are within quantization error of the original
+        dequantized = decoded_vertices[:, :3].astype(np.float32) / 32767
+        np.testing.assert_allclose(dequantized, self.vertices, rtol=0, atol=1 / 32767)
+
+    def test_encode_decode_float_vertices_keep_dtype(self):
+        """Test that floating point vertices keep their dtype when keep_dtype is set."""
+        for dtype, components in ((np.float16, 4), (np.float64, 4)):
+            with self.subTest(dtype=np.dtype(dtype).name):
+                vertices = np.zeros((len(self.vertices), components), dtype=dtype)
+                vertices[:, :3] = self.vertices
+                vertex_size = vertices.itemsize * components
+
+                encoded_vertices = encode_vertex_buffer(vertices, keep_dtype=True)
+                decoded_vertices = decode_vertex_buffer(len(vertices), vertex_size, encoded_vertices, dtype)
+
+                self.assertEqual(decoded_vertices.dtype, dtype)
+                np.testing.assert_array_equal(vertices, decoded_vertices)
+
+        # 3 x 16-bit floats is 6 bytes per vertex, which the codec does not accept
+        with self.assertRaises(ValueError):
+            encode_vertex_buffer(self.vertices.astype(np.float16), keep_dtype=True)
+
+        # Types without a native encoding are rejected rather than converted
+        with self.assertRaises(ValueError):
+            encode_vertex_buffer(np.ones((len(self.vertices), 4), dtype=bool), keep_dtype=True)
+
+    def test_decode_vertices_rejects_mismatched_dtype(self):
+        """Test that decoding rejects a dtype that does not evenly divide the vertex size."""
+        encoded_vertices = encode_vertex_buffer(self.vertices)
+
+        # 12-byte vertices cannot be split into 8-byte components
+        with self.assertRaises(ValueError):
+            decode_vertex_buffer(len(self.vertices), 12, encoded_vertices, np.int64)
+
+    def test_encode_decode_unaligned_integer_vertices(self):
+        """Test that integer vertices with an unsupported vertex size are only encoded as float32."""
+        # 3 x 16-bit components is 6 bytes per vertex, which the codec does not accept
+        quantized = np.round(self.vertices * 32767).astype(np.int16)
+
+        # By default the data is converted to float32 before encoding
+        encoded_vertices = encode_vertex_buffer(quantized)
+        decoded_vertices = decode_vertex_buffer(len(quantized), 12, encoded_vertices)
+        np.testing.assert_array_equal(quantized.astype(np.float32), decoded_vertices)
+
+        # The native layout can't be encoded
+        with self.assertRaises(ValueError):
+            encode_vertex_buffer(quantized, keep_dtype=True)
+
+    def test_encode_decode_integer_list_vertices(self):
+        """Test that integer data is converted to float32 unless keep_dtype is set."""
+        vertices = [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+        expected = np.array(vertices, dtype=np.float32)
+
+        for data in (vertices, np.array(vertices, dtype=np.int32)):
+            with self.subTest(type=type(data).__name__):
+                encoded_vertices = encode_vertex_buffer(data)
+                decoded_vertices = decode_vertex_buffer(3, 12, encoded_vertices)
+                np.testing.assert_array_equal(expected, decoded_vertices)
+
     def test_encode_decode_index_buffer(self):
         """Test that encoding and decoding indices preserves the data."""
         # Encode indices
@@ -94,9 +188,22 @@ class TestEncoding(unittest.TestCase):
         
         # The encoding/decoding process may reorder indices for optimization
         # So we don't check that the indices match exactly, but that they represent the same triangles
-        original_triangles = self.get_triangles_set(self.vertices, self.indices)
         decoded_triangles = self.get_triangles_set(self.vertices, decoded_indices)
-        self.assertEqual(original_triangles, decoded_triangles)
+        self.assertEqual(self.original_triangles, decoded_triangles)
+    
+    def test_encode_decode_uint16_indices(self):
+        """Test that indices can be decoded into a 16-bit index buffer."""
+        indices = self.indices.astype(np.uint16)
+
+        # Encode indices
+        encoded_indices = encode_index_buffer(indices, len(indices), len(self.vertices))
+
+        # Decode indices using 2 bytes per index
+        decoded_indices = decode_index_buffer(len(indices), 2, encoded_indices)
+
+        self.assertEqual(decoded_indices.dtype, np.uint16)
+        decoded_triangles = self.get_triangles_set(self.vertices, decoded_indices)
+        self.assertEqual(self.original_triangles, decoded_triangles)
     
     def test_encode_decode_index_sequence(self):
         """Test that encoding and decoding index sequence preserves the data."""
@@ -116,9 +223,8 @@ class TestEncoding(unittest.TestCase):
         
         # The encoding/decoding process may reorder indices for optimization
         # So we don't check that the indices match exactly, but that they represent the same triangles
-        original_triangles = self.get_triangles_set(self.vertices, self.indices)
         decoded_triangles = self.get_triangles_set(self.vertices, decoded_sequence)
-        self.assertEqual(original_triangles, decoded_triangles)
+        self.assertEqual(self.original_triangles, decoded_triangles)
 
 
 if __name__ == '__main__':
@@ -15,50 +15,58 @@ from meshoptimizer import (
     remap_index_buffer
 )
 
+# A simple mesh (a cube), shared read-only by all tests
+_CUBE_VERTICES = np.array([
+    # positions          
+    [-0.5, -0.5, -0.5],
+    [0.5, -0.5, -0.5],
+    [0.5, 0.5, -0.5],
+    [-0.5, 0.5, -0.5],
+    [-0.5, -0.5, 0.5],
+    [0.5, -0.5, 0.5],
+    [0.5, 0.5, 0.5],
+    [-0.5, 0.5, 0.5]
+], dtype=np.float32)
+
+_CUBE_INDICES = np.array([
+    0, 1, 2, 2, 3, 0,  # front
+    1, 5, 6, 6, 2, 1,  # right
+    5, 4, 7, 7, 6, 5,  # back
+    4, 0, 3, 3, 7, 4,  # left
+    3, 2, 6, 6, 7, 3,  # top
+    4, 5, 1, 1, 0, 4   # bottom
+], dtype=np.uint32)
+
+_CUBE_VERTICES.setflags(write=False)
+_CUBE_INDICES.setflags(write=False)
+
+
 class TestOptimization(unittest.TestCase):
     """Test optimization functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        # Create a simple mesh (a cube)
-        self.vertices = np.array([
-            # positions          
-            [-0.5, -0.5, -0.5],
-            [0.5, -0.5, -0.5],
-            [0.5, 0.5, -0.5],
-            [-0.5, 0.5, -0.5],
-            [-0.5, -0.5, 0.5],
-            [0.5, -0.5, 0.5],
-            [0.5, 0.5, 0.5],
-            [-0.5, 0.5, 0.5]
-        ], dtype=np.float32)
-
-        self.indices = np.array([
-            0, 1, 2, 2, 3, 0,  # front
-            1, 5, 6, 6, 2, 1,  # right
-            5, 4, 7, 7, 6, 5,  # back
-            4, 0, 3, 3, 7, 4,  # left
-            3, 2, 6, 6, 7, 3,  # top
-            4, 5, 1, 1, 0, 4   # bottom
-        ], dtype=np.uint32)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data shared by all tests."""
+        # Use a simple mesh (a cube)
+        cls.vertices = _CUBE_VERTICES
+        cls.indices = _CUBE_INDICES
+        cls.original_triangles = cls.get_triangles_set(cls.vertices, cls.indices)
         
     
-    def get_triangles_set(self, vertices, indices):
+    @staticmethod
+    def get_triangles_set(vertices, indices):
         """
         Get a set of triangles from vertices and indices.
-        Each triangle is represented as a frozenset of tuples of vertex coordinates.
-        This makes the comparison invariant to vertex order within triangles.
+        Each triangle is represented as the bytes of its vertex coordinates, with
+        the three vertices sorted. This makes the comparison invariant to vertex
+        order within triangles.
         """
-        triangles = set()
-        for i in range(0, len(indices), 3):
-            # Get the three vertices of the triangle
-            v1 = tuple(vertices[indices[i]])
-            v2 = tuple(vertices[indices[i+1]])
-            v3 = tuple(vertices[indices[i+2]])
-            # Create a frozenset of the vertices (order-invariant)
-            triangle = frozenset([v1, v2, v3])
-            triangles.add(triangle)
-        return triangles
+        # View each vertex as a single opaque value so that it can be sorted as a whole
+        vertices = np.ascontiguousarray(vertices)
+        vertex_keys = vertices.view(np.dtype((np.void, vertices.itemsize * vertices.shape[1]))).ravel()
+        # Gather the vertices of every triangle and sort them (order-invariant)
+        triangles = np.sort(vertex_keys[indices].reshape(-1, 3), axis=1)
+        return set(map(bytes, triangles))
     
     def test_vertex_cache_optimization(self):
         """Test vertex cache optimization."""
@@ -75,11 +83,10 @@ class TestOptimization(unittest.TestCase):
         self.assertEqual(len(self.indices), len(optimized_indices))
         
         # Get the triangles from the original and optimized meshes
-        original_triangles = self.get_triangles_set(self.vertices, self.indices)
         optimized_triangles = self.get_triangles_set(self.vertices, optimized_indices)
         
         # Check that the triangles match
-        self.assertEqual(original_triangles, optimized_triangles)
+        self.assertEqual(self.original_triangles, optimized_triangles)
     
     def test_overdraw_optimization(self):
         """Test overdraw optimization."""
@@ -99,19 +106,19 @@ class TestOptimization(unittest.TestCase):
         self.assertEqual(len(self.indices), len(optimized_indices))
         
         # Get the triangles from the original and optimized meshes
-        original_triangles = self.get_triangles_set(self.vertices, self.indices)
         optimized_triangles = self.get_triangles_set(self.vertices, optimized_indices)
         
         # Check that the triangles match
-        self.assertEqual(original_triangles, optimized_triangles)
+        self.assertEqual(self.original_triangles, optimized_triangles)
     
     def test_vertex_fetch_optimization(self):
         """Test vertex fetch optimization."""
-        # Optimize vertex fetch
+        # Optimize vertex fetch; this remaps the indices in place, so work on a copy
+        indices = self.indices.copy()
         optimized_vertices = np.zeros_like(self.vertices)
         unique_vertex_count = optimize_vertex_fetch(
             optimized_vertices, 
-            self.indices, 
+            indices, 
             self.vertices, 
             len(self.indices), 
             len(self.vertices), 
@@ -127,19 +134,26 @@ class TestOptimization(unittest.TestCase):
         # that each vertex in the optimized mesh is present in the original mesh.
         
         # Check that all optimized vertices are present in the original vertices
-        for i in range(unique_vertex_count):
-            vertex = tuple(optimized_vertices[i])
-            # Check if this vertex exists in the original vertices
-            found = False
-            for j in range(len(self.vertices)):
-                if np.allclose(self.vertices[j], optimized_vertices[i]):
-                    found = True
-                    break
-            self.assertTrue(found, f"Vertex {vertex} not found in original vertices")
+        # (vertices are copied verbatim, so their bytes can be used as set keys)
+        original_vertices = {vertex.tobytes() for vertex in self.vertices}
+        for vertex in optimized_vertices[:unique_vertex_count]:
+            self.assertIn(vertex.tobytes(), original_vertices, f"Vertex {vertex} not found in original vertices")
         
         # Check that the number of triangles is the same
         self.assertEqual(len(self.indices) // 3, len(self.indices) // 3)
-    
+
+    def test_vertex_fetch_rejects_read_only_indices(self):
+        """Test that vertex fetch optimization refuses to remap read-only indices in place."""
+        optimized_vertices = np.zeros_like(self.vertices)
+        with self.assertRaises(ValueError):
+            optimize_vertex_fetch(optimized_vertices, self.indices, self.vertices)
+
+        # Indices that have to be converted anyway are remapped in a copy
+        indices = self.indices.astype(np.int32)
+        indices.setflags(write=False)
+        optimize_vertex_fetch(optimized_vertices, indices, self.vertices)
+        np.testing.assert_array_equal(indices, self.indices)
+
     def test_vertex_remap(self):
         """Test vertex remapping."""
         # Generate vertex remap
@@ -176,11 +190,10 @@ class TestOptimization(unittest.TestCase):
         )
         
         # Get the triangles from the original and remapped meshes
-        original_triangles = self.get_triangles_set(self.vertices, self.indices)
         remapped_triangles = self.get_triangles_set(remapped_vertices, remapped_indices)
         
         # Check that the triangles match
-        self.assertEqual(original_triangles, remapped_triangles)
+        self.assertEqual(self.original_triangles, remapped_triangles)
     
 
 if __name__ == '__main__':
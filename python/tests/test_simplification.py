@@ -15,32 +15,41 @@ from meshoptimizer import (
     SIMPLIFY_SPARSE,
 )
 
+# A simple mesh (a cube), shared read-only by all tests
+_CUBE_VERTICES = np.array([
+    # positions          
+    [-0.5, -0.5, -0.5],
+    [0.5, -0.5, -0.5],
+    [0.5, 0.5, -0.5],
+    [-0.5, 0.5, -0.5],
+    [-0.5, -0.5, 0.5],
+    [0.5, -0.5, 0.5],
+    [0.5, 0.5, 0.5],
+    [-0.5, 0.5, 0.5]
+], dtype=np.float32)
+
+_CUBE_INDICES = np.array([
+    0, 1, 2, 2, 3, 0,  # front
+    1, 5, 6, 6, 2, 1,  # right
+    5, 4, 7, 7, 6, 5,  # back
+    4, 0, 3, 3, 7, 4,  # left
+    3, 2, 6, 6, 7, 3,  # top
+    4, 5, 1, 1, 0, 4   # bottom
+], dtype=np.uint32)
+
+_CUBE_VERTICES.setflags(write=False)
+_CUBE_INDICES.setflags(write=False)
+
+
 class TestSimplification(unittest.TestCase):
     """Test simplification functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        # Create a simple mesh (a cube)
-        self.vertices = np.array([
-            # positions          
-            [-0.5, -0.5, -0.5],
-            [0.5, -0.5, -0.5],
-            [0.5, 0.5, -0.5],
-            [-0.5, 0.5, -0.5],
-            [-0.5, -0.5, 0.5],
-            [0.5, -0.5, 0.5],
-            [0.5, 0.5, 0.5],
-            [-0.5, 0.5, 0.5]
-        ], dtype=np.float32)
-
-        self.indices = np.array([
-            0, 1, 2, 2, 3, 0,  # front
-            1, 5, 6, 6, 2, 1,  # right
-            5, 4, 7, 7, 6, 5,  # back
-            4, 0, 3, 3, 7, 4,  # left
-            3, 2, 6, 6, 7, 3,  # top
-            4, 5, 1, 1, 0, 4   # bottom
-        ], dtype=np.uint32)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data shared by all tests."""
+        # Use a simple mesh (a cube)
+        cls.vertices = _CUBE_VERTICES
+        cls.indices = _CUBE_INDICES
         
         
         # Create a more complex mesh (a sphere)
@@ -77,8 +86,8 @@ class TestSimplification(unittest.TestCase):
                 indices.extend([a, b, c])
                 indices.extend([a, c, d])
         
-        self.sphere_vertices = np.array(vertices, dtype=np.float32)
-        self.sphere_indices = np.array(indices, dtype=np.uint32)
+        cls.sphere_vertices = np.array(vertices, dtype=np.float32)
+        cls.sphere_indices = np.array(indices, dtype=np.uint32)
     
     def test_simplify_basic(self):
         """Test basic simplification."""
@@ -107,45 +116,27 @@ class TestSimplification(unittest.TestCase):
     
     def test_simplify_options(self):
         """Test simplification with different options."""
-        # Test with SIMPLIFY_LOCK_BORDER option
-        simplified_indices = np.zeros_like(self.indices)
-        result_error = np.array([0.0], dtype=np.float32)
-        
-        new_index_count = simplify(
-            simplified_indices, 
-            self.indices, 
-            self.vertices, 
-            len(self.indices), 
-            len(self.vertices), 
-            self.vertices.itemsize * self.vertices.shape[1], 
-            len(self.indices) // 2,  # Target 50% reduction
-            0.01,  # Target error
-            SIMPLIFY_LOCK_BORDER,  # Lock border vertices
-            result_error
-        )
-        
-        # Check that the number of indices is reduced
-        self.assertLessEqual(new_index_count, len(self.indices))
-        
-        # Test with SIMPLIFY_SPARSE option
-        simplified_indices = np.zeros_like(self.indices)
-        result_error = np.array([0.0], dtype=np.float32)
-        
-        new_index_count = simplify(
-            simplified_indices, 
-            self.indices, 
-            self.vertices, 
-            len(self.indices), 
-            len(self.vertices), 
-            self.vertices.itemsize * self.vertices.shape[1], 
-            len(self.indices) // 2,  # Target 50% reduction
-            0.01,  # Target error
-            SIMPLIFY_SPARSE,  # Sparse simplification
-            result_error
-        )
-        
-        # Check that the number of indices is reduced
-        self.assertLessEqual(new_index_count, len(self.indices))
+        # Lock border vertices, then sparse simplification
+        for options in (SIMPLIFY_LOCK_BORDER, SIMPLIFY_SPARSE):
+            with self.subTest(options=options):
+                simplified_indices = np.zeros_like(self.indices)
+                result_error = np.array([0.0], dtype=np.float32)
+                
+                new_index_count = simplify(
+                    simplified_indices, 
+                    self.indices, 
+                    self.vertices, 
+                    len(self.indices), 
+                    len(self.vertices), 
+                    self.vertices.itemsize * self.vertices.shape[1], 
+                    len(self.indices) // 2,  # Target 50% reduction
+                    0.01,  # Target error
+                    options,
+                    result_error
+                )
+                
+                # Check that the number of indices is reduced
+                self.assertLessEqual(new_index_count, len(self.indices))
     
     def test_simplify_sloppy(self):
         """Test sloppy simplification."""
@@ -173,8 +164,9 @@ class TestSimplification(unittest.TestCase):
     
     def test_simplify_points(self):
         """Test point cloud simplification."""
-        # Create a point cloud
-        points = np.random.rand(100, 3).astype(np.float32)
+        # Create a point cloud (seeded so that the test is reproducible)
+        rng = np.random.default_rng(0)
+        points = rng.random((100, 3), dtype=np.float32)
         
         # Simplify the point cloud
         simplified_points = np.zeros(50, dtype=np.uint32)
@@ -194,7 +186,7 @@ class TestSimplification(unittest.TestCase):
         self.assertLessEqual(new_point_count, 50)
         
         # Test with colors
-        colors = np.random.rand(100, 3).astype(np.float32)
+        colors = rng.random((100, 3), dtype=np.float32)
         
         simplified_points = np.zeros(50, dtype=np.uint32)
         